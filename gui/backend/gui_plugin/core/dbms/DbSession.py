@@ -209,11 +209,13 @@ class DbSession(threading.Thread):
 
         # Now execute
         for setup_task in self._setup_tasks:
-            setup_task.on_connect()
+            if setup_task.on_connect is not None:
+                setup_task.on_connect()
 
     def _on_connected(self, notify_success):
         for setup_task in self._setup_tasks:
-            setup_task.on_connected()
+            if setup_task.on_connected is not None:
+                setup_task.on_connected()
 
     def _on_failed_connection(self):
         for setup_task in self._setup_tasks:
@@ -22,7 +22,10 @@
 # 51 Franklin St, Fifth Floor, Boston, MA 02110-1301 USA
 
 from gui_plugin.core.dbms import DbSessionData as DbSessionData
-from gui_plugin.core.dbms.DbSessionUtils import DbPingHandler
+from gui_plugin.core.dbms.DbSessionUtils import DbPingScheduler
+
+# Marks values not found on the connection options or session data
+_MISSING = object()
 
 
 class DbSessionSetupTask:
@@ -93,7 +96,9 @@ class DbSessionSetupTask:
         Defines an option on the connection options and the output options.
         """
         # Will cause the option to be backed up if existed
-        self.extract_option(option)
+        value_before = self.connection_options.pop(option, _MISSING)
+        if value_before is not _MISSING:
+            self._input_options[option] = value_before
 
         # Defines the new value for the option
         self.connection_options[option] = value
@@ -106,8 +111,10 @@ class DbSessionSetupTask:
 
         # If the data already exists and was not added by the task,
         # backs up the current value
-        if option in self.session.data and option not in self._output_data:
-            self._input_data[option] = self.session.data[option]
+        if option not in self._output_data:
+            value_before = self.session.data.get(option, _MISSING)
+            if value_before is not _MISSING:
+                self._input_data[option] = value_before
 
         # Defines the new value for the data
         self.session.data[option] = value
@@ -118,31 +125,28 @@ class DbSessionSetupTask:
         Progress callback to be used if the task is of long duration to keep the
         clients up to date on what's going on.
         """
-        if self._progress_cb is not None:
-            self._progress_cb(msg)
+        progress_cb = self._progress_cb
+        if progress_cb is not None:
+            progress_cb(msg)
 
     def reset(self, include_data=True):
         """
         Resets any change done by this task on the session connection options.
         """
         # Removes any option added from this task
-        for option in self._output_options.keys():
-            if option in self.connection_options:
-                self.connection_options.pop(option)
+        for option in self._output_options:
+            self.connection_options.pop(option, None)
 
         # Adds any option removed by this task
-        for option, value in self._input_options.items():
-            self.connection_options[option] = value
+        self.connection_options.update(self._input_options)
 
         if include_data:
             # Removes any data added from this task
-            for option in self._output_data.keys():
-                if option in self.session.data:
-                    self.session.data.pop(option)
+            for option in self._output_data:
+                self.session.data.pop(option, None)
 
             # Adds any data removed by this task
-            for option, value in self._input_data.items():
-                self.session.data[option] = value
+            self.session.data.update(self._input_data)
 
             self._input_data.clear()
             self._output_data.clear()
@@ -150,22 +154,18 @@ class DbSessionSetupTask:
         self._input_options.clear()
         self._output_options.clear()
 
-    def on_connect(self):
-        """
-        Override this function to implement task to be executed right before
-        executing the MySQL Session.
+    # Override on_connect with a function to implement a task to be executed
+    # right before executing the MySQL Session.
+    #
+    # IMPORTANT: Any non official connection option should be removed here to
+    # avoid connection errors from the Shell.
+    #
+    # Hooks left as None are skipped by the session.
+    on_connect = None
 
-        IMPORTANT: Any non official connection option should be removed here to
-        avoid connection errors from the Shell.
-        """
-        pass
-
-    def on_connected(self):
-        """
-        Override this function to implement task to be executed right after the
-        MySQL Session has been established
-        """
-        pass
+    # Override on_connected with a function to implement a task to be executed
+    # right after the MySQL Session has been established
+    on_connected = None
 
     def on_failed_connection(self):
         """
@@ -183,25 +183,36 @@ class DbSessionSetupTask:
 
 
 class DbPingHandlerTask(DbSessionSetupTask):
+    _OPT = 'proxysql-fronted'
+
     def __init__(self, session, progress_cb=None) -> None:
         super().__init__(session, progress_cb)
 
-        # The check is enabled if the value is not known
-        self._db_pinger = None
+        self._ping_registered = False
+        self._skip_ping = False
 
     def reset(self, include_data=True):
         super().reset(include_data)
 
         self.on_close()
 
+    def on_connect(self):
+        # No matter what, the option should be removed if exists
+        self._skip_ping = self.extract_option(self._OPT, False)
+
     def on_connected(self):
+        # ProxySQL answers the pings itself, keeping the session alive is
+        # not needed on this case
+        if self._skip_ping:
+            return
+
         if self.session.has_data(DbSessionData.PING_INTERVAL):
             interval = self.session.data[DbSessionData.PING_INTERVAL]
             if interval is not None and interval > 0:
-                self._db_pinger = DbPingHandler(self.session, interval)
-                self._db_pinger.start()
+                DbPingScheduler.instance().register(self.session, interval)
+                self._ping_registered = True
 
     def on_close(self):
-        if self._db_pinger is not None:
-            self._db_pinger.stop()
-            self._db_pinger.join()
+        if self._ping_registered:
+            DbPingScheduler.instance().unregister(self.session)
+            self._ping_registered = False
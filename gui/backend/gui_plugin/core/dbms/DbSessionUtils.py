@@ -22,7 +22,11 @@
 # 51 Franklin St, Fifth Floor, Boston, MA 02110-1301 USA
 import threading
 import enum
+import functools
+import heapq
+import itertools
 import time
+import weakref
 
 import gui_plugin.core.Logger as logger
 
@@ -31,84 +35,136 @@ class DbSessionData(enum.Enum):
     PING_INTERVAL = 0
 
 
-class DbPingHandler(threading.Thread):
+class DbPingScheduler(threading.Thread):
     """
-    Schedules a dummy query on the given session with a defined interval.
+    Schedules a dummy query on the registered sessions, each one with its own
+    interval.
 
     This is required to prevent bastion sessions to disconnect after few
     minutes of inactivity.
-    """
 
-    def __init__(self, session, interval):
-        super().__init__()
-        self.session = session
-        self.interval = interval
-        self.condition = threading.Condition()
-        self.pause_condition = threading.Condition()
-        self._paused = False
-
-    @property
-    def paused(self):
-        return self._paused
-
-    @paused.setter
-    def paused(self, value):
-        self._paused = value
-
-    def unpause(self):
-        self.paused = False
-        with self.pause_condition:
-            self.pause_condition.notify()
-
-    def on_execute_state(self, task, state):
-        # Statements coming from this thread should not pause/unpause the pinger
-        if task is None or task.thread_id != self.native_id:
-            with self.condition:
-                if state == "started":
-                    self.paused = True
-                    self.condition.notify()
-                else:
-                    self.unpause()
-
-    def stop(self):
+    A single scheduler thread serves all the sessions, the next due ping is
+    tracked on a heap of (deadline, counter, entry) items. Any task executed
+    on a session postpones its next ping, so pings are only sent on idle
+    sessions.
+    """
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    class _Entry:
+        def __init__(self, session, interval):
+            self.key = id(session)
+            self.session = weakref.ref(session)
+            self.interval = interval
+            self.counter = None
+            self.active = True
+
+    @classmethod
+    def instance(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+                cls._instance.start()
+            return cls._instance
+
+    def __init__(self):
+        super().__init__(name="db-ping-scheduler", daemon=True)
+        self._condition = threading.Condition()
+        self._heap = []
+        self._entries = {}
+        self._counter = itertools.count()
+
+    def register(self, session, interval):
         """
-        Stops the ping scheduling.
+        Starts the ping scheduling for the given session.
         """
-        # If stops while paused, release the pause and waits to release the
-        # main condition to guarantee the next condition notification ends
-        #  the main loop
-        if self.paused:
-            self.on_execute_state(None, "finished")
-            time.sleep(0.5)
+        with self._condition:
+            self._unregister(session)
 
-        # Ends the main loop
-        with self.condition:
-            self.condition.notify()
+            entry = DbPingScheduler._Entry(session, interval)
+            self._entries[id(session)] = entry
+            session.add_task_execution_callback(
+                functools.partial(self._on_execute_state, entry))
+
+            self._schedule(entry)
+
+    def unregister(self, session):
+        """
+        Stops the ping scheduling for the given session.
+        """
+        with self._condition:
+            self._unregister(session)
+
+    def _unregister(self, session):
+        entry = self._entries.pop(id(session), None)
+        if entry is not None:
+            entry.active = False
+
+    def _is_stale(self, item):
+        _, counter, entry = item
+        return not entry.active or counter != entry.counter
+
+    def _schedule(self, entry):
+        # Any previously scheduled item for the entry becomes stale
+        entry.counter = next(self._counter)
+        heapq.heappush(self._heap, (time.monotonic() +
+                       entry.interval, entry.counter, entry))
+        self._condition.notify()
+
+    def _on_execute_state(self, entry, task, state):
+        # Statements coming from this thread should not reschedule the ping
+        if task is not None and task.thread_id == self.native_id:
+            return
+
+        with self._condition:
+            if not entry.active:
+                return
+
+            if state == "started":
+                # No pings while a task is being executed
+                entry.counter = None
+            else:
+                self._schedule(entry)
 
     def dispatch_result(self, state, message=None, id=None, data=None):
         logger.debug3(
-            f"{self.native_id}  DBPingHandler State: {state}")
+            f"{self.native_id}  DbPingScheduler State: {state}")
 
-    def run(self):
-        done = False
-        self.session.add_task_execution_callback(self.on_execute_state)
-        while not done:
-            with self.condition:
-                # Wait until the condition is met which could be in the
-                # following cases:
-                # - a) When the timer expires (done is False on this case)
-                # - b) When a Task starts being executed using the target session
-                # - c) When the Session is closed (the timer stops processing)
-                done = self.condition.wait(self.interval)
-
-            # Handles case b, the pinger is paused on this case
-            if done and self.paused:
-                with self.pause_condition:
-                    self.pause_condition.wait()
-                    done = False
+    def _next_due_sessions(self):
+        with self._condition:
+            while True:
+                # Discards the stale items
+                while self._heap and self._is_stale(self._heap[0]):
+                    heapq.heappop(self._heap)
+
+                if not self._heap:
+                    self._condition.wait()
+                    continue
+
+                timeout = self._heap[0][0] - time.monotonic()
+                if timeout > 0:
+                    self._condition.wait(timeout)
                     continue
 
-            # Handles case a, we ping the target server
-            if not done:
-                self.session.execute(
-                    "SELECT 1", callback=self.dispatch_result)
+                _, _, entry = heapq.heappop(self._heap)
+                session = entry.session()
+                if session is None:
+                    # The session is gone without being unregistered
+                    if self._entries.get(entry.key) is entry:
+                        del self._entries[entry.key]
+                    entry.active = False
+                    continue
+
+                self._schedule(entry)
+                return session
+
+    def run(self):
+        while True:
+            session = self._next_due_sessions()
+            try:
+                session.execute("SELECT 1", callback=self.dispatch_result)
+            except Exception as e:
+                logger.debug3(f"DbPingScheduler failed to ping: {e}")
+
+            # Don't keep the session alive while waiting for the next ping
+            session = None
@@ -25,6 +25,8 @@ import pytest
 import gui_plugin.core.dbms.DbMySQLSessionSetupTasks as Tasks
 import gui_plugin.core.dbms.DbMySQLSession as DbMySQLSession
 import gui_plugin.core.dbms.DbMySQLSessionCommon as common
+from gui_plugin.core.dbms.DbSessionSetupTask import DbPingHandlerTask
+from gui_plugin.core.dbms.DbSessionUtils import DbPingScheduler, DbSessionData
 
 
 class MockResult:
@@ -222,3 +224,28 @@ class TestHeatWaveCheckTask:
                 session.reconnect()
         except Exception as e:
             assert False, f"Unexpected Error Happened: {str(e)}"
+
+
+class TestDbPingHandlerTask:
+    def test_proxysql_fronted(self):
+        try:
+            for fronted in [True, False]:
+                options = {'scheme': 'mysql',
+                           DbPingHandlerTask._OPT: fronted}
+                on_connect_options = options.copy()
+                on_connect_options.pop(DbPingHandlerTask._OPT)
+                known_data = {DbSessionData.PING_INTERVAL: 60}
+
+                session = MockDbSession(DbPingHandlerTask,
+                                        True,
+                                        options,
+                                        on_connect_options,
+                                        known_data,
+                                        known_data=known_data)
+
+                registered = id(session) in DbPingScheduler.instance()._entries
+                assert registered != fronted, "Unexpected ping scheduling"
+
+                DbPingScheduler.instance().unregister(session)
+        except Exception as e:
+            assert False, f"Unexpected Error Happened: {str(e)}"
@@ -0,0 +1,77 @@
+# Copyright (c) 2024, Oracle and/or its affiliates.
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2.0,
+# as published by the Free Software Foundation.
+#
+# This program is designed to work with certain software (including
+# but not limited to OpenSSL) that is licensed under separate terms, as
+# designated in a particular file or component or in included license
+# documentation.  The authors of MySQL hereby grant you an additional
+# permission to link the program and your derivative works with the
+# separately licensed software that they have either included with
+# the program or referenced in the documentation.
+#
+# This program is distributed in the hope that it will be useful,  but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See
+# the GNU General Public License, version 2.0, for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin St, Fifth Floor, Boston, MA 02110-1301 USA
+
+import time
+
+from gui_plugin.core.dbms.DbSessionUtils import DbPingScheduler
+
+
+class MockTask:
+    thread_id = -1
+
+
+class MockPingSession:
+    def __init__(self) -> None:
+        self.callbacks = []
+        self.pings = 0
+
+    def add_task_execution_callback(self, cb):
+        self.callbacks.append(cb)
+
+    def notify_task_execution_state(self, task, state):
+        for cb in self.callbacks:
+            cb(task, state)
+
+    def execute(self, sql, callback=None):
+        self.pings += 1
+
+
+class TestDbPingScheduler:
+    def test_ping_idle_session(self):
+        session = MockPingSession()
+        scheduler = DbPingScheduler.instance()
+        scheduler.register(session, 0.1)
+        try:
+            time.sleep(0.35)
+            assert session.pings >= 2
+        finally:
+            scheduler.unregister(session)
+
+        pings = session.pings
+        time.sleep(0.3)
+        assert session.pings == pings
+
+    def test_no_ping_while_busy(self):
+        session = MockPingSession()
+        scheduler = DbPingScheduler.instance()
+        scheduler.register(session, 0.1)
+        try:
+            session.notify_task_execution_state(MockTask(), "started")
+            time.sleep(0.3)
+            assert session.pings == 0
+
+            session.notify_task_execution_state(MockTask(), "finished")
+            time.sleep(0.25)
+            assert session.pings >= 1
+        finally:
+            scheduler.unregister(session)
@@ -220,6 +220,9 @@ export interface IMySQLConnectionOptions {
 
     /** MRS service host for this connection */
     "mrs-service-host"?: string;
+
+    /** the connection goes through ProxySQL, which answers the keep-alive pings itself */
+    "proxysql-fronted"?: boolean;
 }
 
 export const getMySQLDbConnectionUri = (details: IConnectionDetails): string => {
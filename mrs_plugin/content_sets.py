@@ -247,6 +247,7 @@ def add_content_set(service_id=None, content_dir=None, **kwargs):
                 if content_set:
                     lib.core.delete(table="content_set",
                                     where="id=?").exec(session, [content_set.get("id")])
+                    lib.core.clear_service_path_cache()
 
             # Create the content_set, ensure it is created as "not enabled"
             content_set_id, files_added = lib.content_sets.add_content_set(
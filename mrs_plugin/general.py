@@ -28,6 +28,9 @@
 from mysqlsh.plugin_manager import plugin_function
 import mrs_plugin.lib as lib
 
+_INFO_TEXT = (f"MySQL REST Data Service (MRS) Plugin Version {lib.general.VERSION} PREVIEW\n"
+              "Warning! For testing purposes only!")
+
 
 @plugin_function('mrs.info', shell=True, cli=True, web=True)
 def info():
@@ -36,8 +39,7 @@ def info():
     Returns:
         str
     """
-    return (f"MySQL REST Data Service (MRS) Plugin Version {lib.general.VERSION} PREVIEW\n"
-            "Warning! For testing purposes only!")
+    return _INFO_TEXT
 
 
 @plugin_function('mrs.version', shell=True, cli=True, web=True)
@@ -83,7 +85,7 @@ def ls(path=None, session=None):
         if not service:
             print("List of MRS Services\n")
             services = lib.services.get_services(session)
-            if services and len(services) > 0:
+            if services:
                 print(lib.services.format_service_listing(services=services,
                                                           print_header=True))
             else:
@@ -91,16 +93,17 @@ def ls(path=None, session=None):
                       "to add a service.")
             return
 
-        # List service content
-        if service and not schema and not content_set:
-            print(f"MRS Service {service.get('host_ctx')}\n")
-            schemas = lib.schemas.get_schemas(
-                service_id=service.get('id'), session=session)
-            content_sets = lib.content_sets.get_content_sets(
-                service_id=service.get('id'), session=session)
+        service_host_ctx = service.get('host_ctx')
 
-            auth_apps = lib.auth_apps.get_auth_apps(
+        # List service content
+        if not schema and not content_set:
+            print(f"MRS Service {service_host_ctx}\n")
+            items = lib.services.get_service_overview(
                 service_id=service.get('id'), session=session)
+            schemas = [item for item in items if item['kind'] == 'schema']
+            content_sets = [
+                item for item in items if item['kind'] == 'content_set']
+            auth_apps = [item for item in items if item['kind'] == 'auth_app']
 
             if not schemas and not content_sets:
                 print("No schemas added to this service yet.\n\n"
@@ -108,23 +111,23 @@ def ls(path=None, session=None):
             if schemas:
                 print("List of Schemas")
                 print(lib.schemas.format_schema_listing(
-                    schemas=schemas, print_header=True) + "\n")
+                    schemas=schemas, print_header=True), end="\n\n")
             if content_sets:
                 print("List of Content Sets")
                 print(lib.content_sets.format_content_set_listing(
-                    content_sets=content_sets, print_header=True) + "\n")
+                    content_sets=content_sets, print_header=True), end="\n\n")
             if auth_apps:
                 print("List of Authentication Apps")
                 print(lib.auth_apps.format_auth_app_listing(
-                    auth_apps=auth_apps, print_header=True) + "\n")
+                    auth_apps=auth_apps, print_header=True), end="\n\n")
 
         # List schema objects
-        if service and schema:
-            print(f"MRS Service {service.get('host_ctx')}"
+        if schema:
+            print(f"MRS Service {service_host_ctx}"
                   f"{schema.get('request_path')} - Database Objects\n")
             db_objects = lib.db_objects.get_db_objects(
                 session=session, schema_id=schema.get('id'))
-            if len(db_objects) > 0:
+            if db_objects:
                 print(lib.db_objects.format_db_object_listing(
                     db_objects=db_objects, print_header=True))
             else:
@@ -133,12 +136,12 @@ def ls(path=None, session=None):
                       "schema.")
 
         # List content_set files
-        if service and content_set:
-            print(f"MRS Service {service.get('host_ctx')}"
+        if content_set:
+            print(f"MRS Service {service_host_ctx}"
                   f"{content_set.get('request_path')} - Content Files\n")
             content_files = lib.content_files.get_content_files(
                 content_set_id=content_set.get('id'), session=session)
-            if len(content_files) > 0:
+            if content_files:
                 print(lib.content_files.format_content_file_listing(
                     content_files=content_files, print_header=True))
             else:
@@ -222,14 +225,15 @@ def cd(path=None, session=None):
                 session=session)
 
             if not current_schema and not current_content_set:
+                current_service_id = current_service.get("id")
                 print(f"MRS Service {current_service.get('host_ctx')} - "
                       "Schema and Content Set Listing:\n")
                 # Get the schema
                 schemas = lib.schemas.get_schemas(
-                    service_id=current_service.get("id"),
+                    service_id=current_service_id,
                     session=session)
                 context_sets = lib.content_sets.get_content_sets(
-                    service_id=current_service.get("id"),
+                    service_id=current_service_id,
                     session=session)
 
                 items = schemas + context_sets
@@ -276,9 +280,10 @@ def configure(session=None, enable_mrs=None, options=None,
 
     session = lib.core.get_current_session(session)
 
-    if lib.core.mrs_metadata_schema_exists(session) and interactive:
-        current_db_version = lib.core.get_mrs_schema_version(session)
+    schema_exists, current_db_version = lib.core.get_mrs_schema_presence_and_version(
+        session)
 
+    if schema_exists and interactive:
         # Major upgrade is required from v1 to v2
         if current_db_version[0] < 2 and not allow_recreation_on_major_upgrade:
             if lib.core.prompt(
@@ -334,12 +339,14 @@ def status(session=None):
 
     with lib.core.MrsDbSession(
             exception_handler=lib.core.print_exception, session=session, check_version=False) as session:
-        if lib.core.get_interactive_default():
+        interactive = lib.core.get_interactive_result()
+
+        if interactive:
             print("Checking the current status of the MRS...\n")
 
         status = lib.general.get_status(session)
 
-        if lib.core.get_interactive_result():
+        if interactive:
             if status.get("service_configured", False) == False:
                 print("The MySQL REST Data Service is not configured yet. "
                       "Run mrs.configure() to configure the service.")
@@ -48,22 +48,19 @@ def format_auth_app_listing(auth_apps, print_header=False):
     else:
         output = ""
 
-    i = 0
-    for item in auth_apps:
-        i += 1
+    def format_row(i, item):
         description = item['description'] if item['description'] is not None else ""
 
         if len(description) > 36:
             description = f"{description[:33]}..."
 
-        output += (f"{i:>3} {item['name'][:25]:26} "
-                   f"{description[:35]:36} "
-                   f"{item['auth_vendor'][:15]:16} "
-                   f"{'Yes' if item['enabled'] else '-':8} ")
-        if i < len(auth_apps):
-            output += "\n"
+        return (f"{i:>3} {item['name'][:25]:26} "
+                f"{description[:35]:36} "
+                f"{item['auth_vendor'][:15]:16} "
+                f"{'Yes' if item['enabled'] else '-':8} ")
 
-    return output
+    return output + "\n".join(
+        format_row(i, item) for i, item in enumerate(auth_apps, start=1))
 
 
 def get_auth_vendors(session, enabled=None):
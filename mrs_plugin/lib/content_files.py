@@ -54,22 +54,19 @@ def format_content_file_listing(content_files, print_header=True):
     else:
         output = ""
 
-    i = 0
-    for item in content_files:
-        i += 1
+    def format_row(i, item):
         path = (item['host_ctx'] + item['content_set_request_path'] +
                 item['request_path'])
         changed_at = str(item['changed_at']) if item['changed_at'] else ""
         file_size = sizeof_fmt(item['size'])
 
-        output += (f"{i:>3} {path[:65]:65} "
-                   f"{'Yes' if item['enabled'] else '-':7} "
-                   f"{'Yes' if item['requires_auth'] else '-':4} "
-                   f"{changed_at[:16]:16} {file_size[:9]:>9}")
-        if i < len(content_files):
-            output += "\n"
+        return (f"{i:>3} {path[:65]:65} "
+                f"{'Yes' if item['enabled'] else '-':7} "
+                f"{'Yes' if item['requires_auth'] else '-':4} "
+                f"{changed_at[:16]:16} {file_size[:9]:>9}")
 
-    return output
+    return output + "\n".join(
+        format_row(i, item) for i, item in enumerate(content_files, start=1))
 
 
 def get_content_file(session, content_file_id: bytes | None = None, content_set_id: bytes | None = None,
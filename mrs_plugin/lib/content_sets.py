@@ -99,15 +99,11 @@ def format_content_set_listing(content_sets, print_header=False):
     else:
         output = ""
 
-    for i, item in enumerate(content_sets, start=1):
-        url = (item['host_ctx'] + item['request_path'])
-        output += (f"{i:>3} {url[:95]:96} "
-                   f"{'Yes' if item['enabled'] else '-':8} "
-                   f"{'Yes' if item['requires_auth'] else '-':5}")
-        if i < len(content_sets):
-            output += "\n"
-
-    return output
+    return output + "\n".join(
+        f"{i:>3} {(item['host_ctx'] + item['request_path'])[:95]:96} "
+        f"{'Yes' if item['enabled'] else '-':8} "
+        f"{'Yes' if item['requires_auth'] else '-':5}"
+        for i, item in enumerate(content_sets, start=1))
 
 
 def delete_content_set(session, content_set_ids: list):
@@ -137,6 +133,8 @@ def delete_content_set(session, content_set_ids: list):
                 core.delete(table="db_schema", where="id=?").exec(
                     session, [row["id"]])
 
+        core.clear_service_path_cache()
+
 
 def enable_content_set(session, content_set_ids: list, value: bool):
     """Makes a given change to a MRS content set
@@ -152,12 +150,16 @@ def enable_content_set(session, content_set_ids: list, value: bool):
     if not content_set_ids:
         raise ValueError("The specified content_set was not found.")
 
-    # Update all given services
-    for content_set_id in content_set_ids:
-        result = core.update(table="content_set",
-                             sets={"enabled": value},
-                             where="id=?"
-                             ).exec(session, [content_set_id])
+    content_set_ids = [core.id_to_binary(content_set_id, "content_set_id")
+                       for content_set_id in content_set_ids]
+
+    # Update all given content sets using a single statement
+    core.update(table="content_set",
+                sets={"enabled": value},
+                where=f"id IN ({','.join(['?'] * len(content_set_ids))})"
+                ).exec(session, content_set_ids)
+
+    core.clear_service_path_cache()
 
 
 def query_content_sets(session, content_set_id: bytes = None, service_id: bytes = None,
@@ -258,7 +260,6 @@ def get_content_set_count(session, service_id: bytes):
 
 def add_content_set(session, service_id, request_path, requires_auth=False, comments="", options=None, enabled=True,
                     content_dir=None, send_gui_message=None, service=None, ignore_list=None):
-
     core.Validations.request_path(request_path, session=session)
 
     contains_mrs_scripts = False
@@ -305,6 +306,7 @@ def add_content_set(session, service_id, request_path, requires_auth=False, comm
 
     # Create the content_set, ensure it is created as "not enabled"
     core.insert(table="content_set", values=values).exec(session)
+    core.clear_service_path_cache()
 
     file_list = None
     if content_dir is not None:
@@ -362,6 +364,8 @@ def update_content_set(session, content_set_id, value, file_ignore_list=None, se
         where=["id=?"]
     ).exec(session, [content_set_id])
 
+    core.clear_service_path_cache()
+
     if contains_mrs_scripts:
         # Update db_schemas/db_objects based on script definition
         script_def = update_scripts_from_content_set(
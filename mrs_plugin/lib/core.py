@@ -35,9 +35,18 @@ import threading
 import base64
 import datetime
 import pathlib
+import time
 
 MRS_METADATA_LOCK_ERROR = "Failed to acquire MRS metadata lock. Please ensure no other metadata update is running, then try again."
 
+# Number of seconds the MRS metadata schema version of a session is cached
+MRS_SCHEMA_VERSION_CACHE_TTL = 10
+MRS_SCHEMA_VERSION_CACHE_SIZE = 32
+
+# Number of seconds a validated service path of a session is cached
+SERVICE_PATH_CACHE_TTL = 10
+SERVICE_PATH_CACHE_SIZE = 64
+
 
 class ConfigFile:
     def __init__(self) -> None:
@@ -104,6 +113,56 @@ class LogLevel(IntEnum):
     DEBUG3 = 8
 
 
+class SessionCache:
+    """Caches values per session and key for a limited amount of time
+
+    The cache is shared between threads, so all access is done under a lock.
+    Expired entries are dropped when they are looked up and whenever a new
+    value is set, so the cache does not keep closed sessions alive.
+    """
+
+    def __init__(self, ttl, max_size) -> None:
+        self._ttl = ttl
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        # Holds (id(session), key): (session, expiry_time, value)
+        self._items = {}
+
+    def get(self, session, key=None):
+        """Returns the cached value or None if there is no valid one"""
+        item_key = (id(session), key)
+        with self._lock:
+            cached = self._items.get(item_key)
+            if cached is None:
+                return None
+            # The session itself is compared as the id of a closed session can
+            # be reused
+            if cached[0] is not session or cached[1] <= time.monotonic():
+                del self._items[item_key]
+                return None
+            return cached[2]
+
+    def set(self, session, value, key=None):
+        now = time.monotonic()
+        with self._lock:
+            for expired in [k for k, v in self._items.items() if v[1] <= now]:
+                del self._items[expired]
+            if len(self._items) >= self._max_size:
+                self._items.clear()
+
+            self._items[(id(session), key)] = (session, now + self._ttl, value)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+
+_mrs_schema_version_cache = SessionCache(
+    MRS_SCHEMA_VERSION_CACHE_TTL, MRS_SCHEMA_VERSION_CACHE_SIZE)
+_service_path_cache = SessionCache(
+    SERVICE_PATH_CACHE_TTL, SERVICE_PATH_CACHE_SIZE)
+
+
 def get_local_config():
     return ConfigFile().settings
 
@@ -157,6 +216,25 @@ def validate_service_path(session, path):
     if not path:
         return None, None, None
 
+    objects = _service_path_cache.get(session, path)
+    if objects is None:
+        objects = _query_service_path(session, path)
+        _service_path_cache.set(session, objects, path)
+
+    # Return copies so the cached objects can't be modified by the caller
+    return tuple(dict(item) if item is not None else None for item in objects)
+
+
+def clear_service_path_cache():
+    """Clears the cached results of validate_service_path()
+
+    Needs to be called after a service, schema or content set has been added,
+    changed or deleted.
+    """
+    _service_path_cache.clear()
+
+
+def _query_service_path(session, path):
     service = None
     schema = None
     content_set = None
@@ -315,6 +393,10 @@ def get_current_session(session=None):
 
 
 def get_mrs_schema_version(session):
+    version = _mrs_schema_version_cache.get(session)
+    if version is not None:
+        return list(version)
+
     row = (
         select(
             table="schema_version",
@@ -332,7 +414,18 @@ def get_mrs_schema_version(session):
     if not row:
         raise Exception("Unable to fetch MRS metadata database schema version.")
 
-    return [row["major"], row["minor"], row["patch"]]
+    version = [row["major"], row["minor"], row["patch"]]
+    _mrs_schema_version_cache.set(session, version)
+
+    return list(version)
+
+
+def clear_mrs_schema_version_cache():
+    """Clears the cached MRS metadata schema versions
+
+    Needs to be called whenever the MRS metadata schema is created or updated.
+    """
+    _mrs_schema_version_cache.clear()
 
 
 def get_mrs_schema_version_int(session):
@@ -355,6 +448,25 @@ def mrs_metadata_schema_exists(session):
     return row["schema_exists"]
 
 
+def get_mrs_schema_presence_and_version(session):
+    """Checks if the MRS metadata schema exists and returns its version
+
+    The existence of the schema is always checked live, as it may have been
+    dropped by plain SQL. Only the version is taken from the cache.
+
+    Args:
+        session (object): The database session to use
+
+    Returns:
+        A tuple (schema_exists, version), version is None if the schema does
+        not exist
+    """
+    if not mrs_metadata_schema_exists(session):
+        return False, None
+
+    return True, get_mrs_schema_version(session)
+
+
 def update_mrs_metadata_schema(session, current_db_version_str):
     """Creates or updates the MRS metadata schema
 
@@ -475,6 +587,8 @@ def update_mrs_metadata_schema(session, current_db_version_str):
             "INFO", f"The MRS metadata schema version has been successfully updated to version {general.DB_VERSION_STR}.")
 
     finally:
+        clear_mrs_schema_version_cache()
+
         if mrs_lock == 1:
             MrsDbExec('SELECT RELEASE_LOCK("MRS_METADATA_LOCK")').exec(session)
 
@@ -557,6 +671,9 @@ def create_mrs_metadata_schema(session, drop_existing=False):
         write_to_metadata_schema_update_log(
             "INFO", f"MRS metadata schema version {version_str} created successfully.")
     finally:
+        clear_mrs_schema_version_cache()
+        clear_service_path_cache()
+
         if mrs_lock == 1:
             MrsDbExec('SELECT RELEASE_LOCK("MRS_METADATA_LOCK")').exec(session)
 
@@ -1122,9 +1239,11 @@ class MrsDbSession:
         self._session = get_current_session(kwargs.get("session"))
         self._exception_handler = kwargs.get("exception_handler")
         check_version = kwargs.get("check_version", True)
-        if mrs_metadata_schema_exists(self._session) and check_version:
-            current_db_version = get_mrs_schema_version(self._session)
-            if current_db_version[0] < 2:
+        # Only query the metadata schema when the version check is requested
+        if check_version:
+            schema_exists, current_db_version = get_mrs_schema_presence_and_version(
+                self._session)
+            if schema_exists and current_db_version[0] < 2:
                 raise Exception(
                     "This MySQL Shell version requires a new major version of the MRS metadata schema, "
                     f"{general.DB_VERSION_STR}. The currently deployed schema version is "
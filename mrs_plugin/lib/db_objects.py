@@ -43,7 +43,7 @@ def format_db_object_listing(db_objects, print_header=False):
     else:
         output = ""
 
-    for i, item in enumerate(db_objects, start=1):
+    def format_row(i, item):
         path = (item['host_ctx'] + item['schema_request_path'] +
                 item['request_path'])
 
@@ -55,16 +55,15 @@ def format_db_object_listing(db_objects, print_header=False):
             if item['crud_operations'] else ""
         changed_at = str(item['changed_at']) if item['changed_at'] else ""
 
-        output += (f"{i:>3} {path[:35]:35} "
-                   f"{item['name'][:30]:30} {crud:4} "
-                   f"{item['object_type'][:9]:10} "
-                   f"{'Yes' if item['enabled'] else '-':7} "
-                   f"{'Yes' if item['requires_auth'] else '-':4} "
-                   f"{changed_at[:16]:16}")
-        if i < len(db_objects):
-            output += "\n"
+        return (f"{i:>3} {path[:35]:35} "
+                f"{item['name'][:30]:30} {crud:4} "
+                f"{item['object_type'][:9]:10} "
+                f"{'Yes' if item['enabled'] else '-':7} "
+                f"{'Yes' if item['requires_auth'] else '-':4} "
+                f"{changed_at[:16]:16}")
 
-    return output
+    return output + "\n".join(
+        format_row(i, item) for i, item in enumerate(db_objects, start=1))
 
 
 def map_crud_operations(crud_operations):
@@ -119,9 +119,9 @@ def configure(session=None, enable_mrs=None, options=None,
 
     with lib.core.MrsDbSession(session=session, check_version=False) as session:
         schema_changed = False
-        if lib.core.mrs_metadata_schema_exists(session):
-            current_db_version = lib.core.get_mrs_schema_version(session)
-
+        schema_exists, current_db_version = lib.core.get_mrs_schema_presence_and_version(
+            session)
+        if schema_exists:
             if lib.general.DB_VERSION < current_db_version:
                 raise Exception(
                     "This version of MySQL Shell does not support the MRS metadata database schema "
@@ -158,19 +158,26 @@ def configure(session=None, enable_mrs=None, options=None,
         else:
             lib.core.create_mrs_metadata_schema(session)
 
-        if enable_mrs is not None:
-            lib.core.update(
-                table="config", sets="service_enabled=?", where="id=1"
-            ).exec(session, [1 if enable_mrs else 0])
-        else:
-            row = lib.core.select(table="config", cols="service_enabled", where="id=1"
-                                  ).exec(session).first
-            enable_mrs = row["service_enabled"] if row else 0
+        row = lib.core.select(table="config", cols="service_enabled", where="id=1"
+                              ).exec(session).first
+        # A missing row or a NULL value means the flag is not stored yet
+        service_enabled = row["service_enabled"] if row else None
+
+        # Collect all config changes to update them using a single statement
+        config_sets = {}
+        if enable_mrs is None:
+            enable_mrs = service_enabled
+        elif service_enabled is None or bool(service_enabled) != bool(enable_mrs):
+            # Only write the flag if it is not stored yet or actually changes
+            config_sets["service_enabled"] = 1 if enable_mrs else 0
 
         if options is not None:
+            config_sets["data"] = options
+
+        if config_sets:
             lib.core.update(
-                table="config", sets="data=?", where="id=1"
-            ).exec(session, [options])
+                table="config", sets=config_sets, where="id=1"
+            ).exec(session)
 
         return {
             "schema_changed": schema_changed,
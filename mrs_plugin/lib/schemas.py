@@ -46,16 +46,12 @@ def format_schema_listing(schemas, print_header=False):
     else:
         output = ""
 
-    for i, item in enumerate(schemas, start=1):
-        url = (item['host_ctx'] + item['request_path'])
-        output += (f"{i:>3} {url[:37]:38} "
-                   f"{item['name'][:29]:30} "
-                   f"{'Yes' if item['enabled'] else '-':8} "
-                   f"{'Yes' if item['requires_auth'] else '-':5}")
-        if i < len(schemas):
-            output += "\n"
-
-    return output
+    return output + "\n".join(
+        f"{i:>3} {(item['host_ctx'] + item['request_path'])[:37]:38} "
+        f"{item['name'][:29]:30} "
+        f"{'Yes' if item['enabled'] else '-':8} "
+        f"{'Yes' if item['requires_auth'] else '-':5}"
+        for i, item in enumerate(schemas, start=1))
 
 
 def prompt_for_request_path(schema_name) -> str:
@@ -96,6 +92,8 @@ def delete_schema(session, schema_id):
         raise Exception(
             f"The specified schema with id {core.convert_id_to_string(schema_id)} was not found.")
 
+    core.clear_service_path_cache()
+
 
 def delete_schemas(session, schemas: list):
     if not schemas:
@@ -128,6 +126,8 @@ def update_schema(session, schemas: list, value: dict):
                     where=["id=?"]
                     ).exec(session, [schema_id])
 
+        core.clear_service_path_cache()
+
 
 def query_schemas(session, schema_id=None, service_id=None,
                   schema_name=None, request_path=None, include_enable_state=None, auto_select_single=False):
@@ -313,6 +313,7 @@ def add_schema(session, schema_name, service_id: bytes = None, request_path=None
         values.pop("internal", None)
 
     core.insert(table="db_schema", values=values).exec(session)
+    core.clear_service_path_cache()
 
     return schema_id
 
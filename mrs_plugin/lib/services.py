@@ -78,16 +78,12 @@ def format_service_listing(services, print_header=False):
     else:
         output = ""
 
-    for i, item in enumerate(services, start=1):
-        url = item.get('url_host_name') + item.get('url_context_root')
-        output += (f"{i:>3} {url[:24]:25} "
-                   f"{'Yes' if item['enabled'] else '-':8} "
-                   f"{','.join(item['url_protocol'])[:19]:20} "
-                   f"{'Yes' if item['is_current'] else '-':5}")
-        if i < len(services):
-            output += "\n"
-
-    return output
+    return output + "\n".join(
+        f"{i:>3} {(item.get('url_host_name') + item.get('url_context_root'))[:24]:25} "
+        f"{'Yes' if item['enabled'] else '-':8} "
+        f"{','.join(item['url_protocol'])[:19]:20} "
+        f"{'Yes' if item['is_current'] else '-':5}"
+        for i, item in enumerate(services, start=1))
 
 
 def format_metadata(host_ctx, version):
@@ -162,6 +158,8 @@ def add_service(session, url_host_name, service):
     if not core.insert(table="service", values=service).exec(session).success:
         raise Exception("Failed to add the new service.")
 
+    core.clear_service_path_cache()
+
     return service["id"]
 
 
@@ -173,6 +171,8 @@ def delete_service(session, service_id):
         raise Exception(
             f"The specified service with id {service_id} was not found.")
 
+    core.clear_service_path_cache()
+
 
 def delete_services(session, service_ids):
     for service_id in service_ids:
@@ -231,6 +231,8 @@ def update_services(session, service_ids, value):
                     sets=value,
                     where=["id=?"]).exec(session, [service_id])
 
+        core.clear_service_path_cache()
+
 
 def query_services(session, service_id: bytes = None, url_context_root=None, url_host_name=None,
                    get_default=False, developer_list=None):
@@ -392,6 +394,70 @@ def get_services(session):
     return query_services(session)
 
 
+def get_service_overview(session, service_id: bytes):
+    """Gets the schemas, content sets and auth apps of a MRS service
+
+    All items are fetched using a single query, each row includes a kind
+    column being either 'schema', 'content_set' or 'auth_app' and the
+    columns required to list the item.
+
+    Args:
+        session (object): The database session to use.
+        service_id: The id of the service
+
+    Returns:
+        List of dicts representing the service items
+    """
+    # Auth apps are linked to services using service_has_auth_app since 3.0.0
+    current_version = core.get_mrs_schema_version(session)
+    if current_version[0] <= 2:
+        auth_app_from = """
+            FROM `mysql_rest_service_metadata`.`auth_app` a
+                LEFT OUTER JOIN `mysql_rest_service_metadata`.`auth_vendor` v
+                    ON v.id = a.auth_vendor_id
+            WHERE a.service_id = ?
+            """
+    else:
+        auth_app_from = """
+            FROM `mysql_rest_service_metadata`.`auth_app` a
+                LEFT OUTER JOIN `mysql_rest_service_metadata`.`service_has_auth_app` sa
+                    ON sa.auth_app_id = a.id
+                LEFT OUTER JOIN `mysql_rest_service_metadata`.`auth_vendor` v
+                    ON v.id = a.auth_vendor_id
+            WHERE sa.service_id = ?
+            """
+
+    sql = f"""
+        SELECT 'schema' AS kind, sc.name, sc.request_path,
+            NULL AS description, NULL AS auth_vendor, sc.enabled, sc.requires_auth,
+            CONCAT(h.name, se.url_context_root) AS host_ctx
+        FROM `mysql_rest_service_metadata`.db_schema sc
+            LEFT OUTER JOIN `mysql_rest_service_metadata`.service se
+                ON se.id = sc.service_id
+            LEFT JOIN `mysql_rest_service_metadata`.url_host h
+                ON se.url_host_id = h.id
+        WHERE sc.service_id = ?
+        UNION ALL
+        SELECT 'content_set' AS kind, NULL AS name, cs.request_path,
+            NULL AS description, NULL AS auth_vendor, cs.enabled, cs.requires_auth,
+            CONCAT(h.name, se.url_context_root) AS host_ctx
+        FROM `mysql_rest_service_metadata`.`content_set` cs
+            LEFT OUTER JOIN `mysql_rest_service_metadata`.`service` se
+                ON se.id = cs.service_id
+            LEFT JOIN `mysql_rest_service_metadata`.`url_host` h
+                ON se.url_host_id = h.id
+        WHERE cs.service_id = ?
+        UNION ALL
+        SELECT 'auth_app' AS kind, a.name, NULL AS request_path,
+            a.description, v.name AS auth_vendor, a.enabled, NULL AS requires_auth,
+            NULL AS host_ctx
+        {auth_app_from}
+        ORDER BY kind, request_path, name
+        """
+
+    return core.MrsDbExec(sql, [service_id, service_id, service_id]).exec(session).items
+
+
 def get_current_service(session):
     service_id = get_current_service_id(session)
 
@@ -449,6 +515,8 @@ def set_current_service_id(session, service_id: bytes):
     config.settings["current_objects"] = current_objects
     config.store()
 
+    core.clear_service_path_cache()
+
 
 def get_create_statement(session, service) -> str:
     executor = MrsDdlExecutor(
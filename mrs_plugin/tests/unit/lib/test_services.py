@@ -188,6 +188,24 @@ def test_get_services(phone_book, table_contents):
         assert len(services) == 1
 
 
+def test_get_service_overview(phone_book):
+    with MrsDbSession(session=phone_book["session"]) as session:
+        service_id = phone_book["service_id"]
+        items = lib.services.get_service_overview(session=session, service_id=service_id)
+
+        schemas = lib.schemas.get_schemas(session=session, service_id=service_id)
+        content_sets = lib.content_sets.get_content_sets(session=session, service_id=service_id)
+        auth_apps = lib.auth_apps.get_auth_apps(session=session, service_id=service_id)
+
+        overview_schemas = [item for item in items if item["kind"] == "schema"]
+        assert [item["request_path"] for item in overview_schemas] == \
+            [item["request_path"] for item in schemas]
+        assert [item["name"] for item in overview_schemas] == [item["name"] for item in schemas]
+
+        assert len([item for item in items if item["kind"] == "content_set"]) == len(content_sets)
+        assert len([item for item in items if item["kind"] == "auth_app"]) == len(auth_apps)
+
+
 def test_change_service(phone_book, table_contents):
     service_table = table_contents("service")
     auth_app_table = table_contents("auth_app")
@@ -122,6 +122,90 @@ def test_get_current_config(phone_book):
                       "current_content_set_id": phone_book["content_set_id"]}
 
 
+def test_get_mrs_schema_version(phone_book):
+    with MrsDbSession(session=phone_book["session"]) as session:
+        version = get_mrs_schema_version(session)
+        assert version == general.DB_VERSION
+
+        # Changing the returned value must not affect the cached one
+        version[0] = 0
+        assert get_mrs_schema_version(session) == general.DB_VERSION
+
+        clear_mrs_schema_version_cache()
+        assert get_mrs_schema_version(session) == general.DB_VERSION
+
+
+def test_get_mrs_schema_presence_and_version(phone_book):
+    with MrsDbSession(session=phone_book["session"]) as session:
+        schema_exists, version = get_mrs_schema_presence_and_version(session)
+        assert schema_exists
+        assert version == general.DB_VERSION
+
+
+def test_get_mrs_schema_presence_and_version_schema_absent(monkeypatch):
+    from ...lib import core
+
+    def fail_version_query(session):
+        assert False, "The version must not be queried without a schema"
+
+    monkeypatch.setattr(core, "mrs_metadata_schema_exists", lambda session: 0)
+    monkeypatch.setattr(core, "get_mrs_schema_version", fail_version_query)
+
+    assert core.get_mrs_schema_presence_and_version(object()) == (False, None)
+
+
+def test_configure_after_schema_drop(phone_book, monkeypatch):
+    from ...lib import core
+
+    with MrsDbSession(session=phone_book["session"]) as session:
+        # Have the version of the session cached
+        assert get_mrs_schema_version(session) == general.DB_VERSION
+
+        # Emulate the metadata schema having been dropped by plain SQL, as
+        # dropping it for real would remove the data of the other tests
+        created = []
+        monkeypatch.setattr(core, "mrs_metadata_schema_exists", lambda session: 0)
+        monkeypatch.setattr(core, "create_mrs_metadata_schema",
+                            lambda session, drop_existing=False: created.append(session))
+
+        assert core.get_mrs_schema_presence_and_version(session) == (False, None)
+
+        general.configure(session=session)
+        assert created == [session]
+
+
+def test_validate_service_path_cache(phone_book):
+    with MrsDbSession(session=phone_book["session"]) as session:
+        service, schema, content_set = validate_service_path(session, "localhost/test/PhoneBook")
+        assert service["id"] == phone_book["service_id"]
+
+        # Changing the returned objects must not affect the cached ones
+        service["host_ctx"] = "changed"
+        cached_service, cached_schema, cached_content_set = validate_service_path(
+            session, "localhost/test/PhoneBook")
+        assert cached_service["host_ctx"] == "localhost/test"
+        assert cached_schema == schema
+        assert cached_content_set == content_set
+
+        clear_service_path_cache()
+        assert validate_service_path(session, "localhost/test/PhoneBook")[0]["host_ctx"] == "localhost/test"
+
+        # Adding and deleting a schema must be visible right away
+        assert validate_service_path(session, "localhost/test/cache_test")[1] is None
+
+        schema_id = add_schema(session=session, schema_name="PhoneBook",
+                               service_id=phone_book["service_id"],
+                               request_path="/cache_test")
+        try:
+            schema = validate_service_path(session, "localhost/test/cache_test")[1]
+            assert schema is not None
+            assert schema["id"] == schema_id
+        finally:
+            delete_schema(session, schema_id)
+
+        assert validate_service_path(session, "localhost/test/cache_test")[1] is None
+
+
 def test_validate_service_path(phone_book):
     with MrsDbSession(session=phone_book["session"]) as session:
         service, schema, content_set = validate_service_path(session, None)
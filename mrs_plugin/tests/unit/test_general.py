@@ -40,7 +40,7 @@ def test_version():
     assert version_output == lib.general.VERSION
 
 
-def test_configure(phone_book):
+def test_configure(phone_book, monkeypatch):
     config = {
         "session": phone_book["session"]
     }
@@ -105,6 +105,41 @@ def test_configure(phone_book):
     assert config_output == {"schema_changed": False,
                              "mrs_enabled": True}
 
+    # Enabling an already enabled service must not write the config row
+    update_tables = []
+    original_update = lib.core.update
+
+    def recording_update(table, *args, **kwargs):
+        update_tables.append(table)
+        return original_update(table, *args, **kwargs)
+
+    monkeypatch.setattr(lib.core, "update", recording_update)
+
+    config_output = configure(**config)
+    assert config_output == {"schema_changed": False,
+                             "mrs_enabled": True}
+    assert "config" not in update_tables
+
+    # A changed flag is still written
+    config_output = configure(session=phone_book["session"], enable_mrs=False)
+    assert config_output == {"schema_changed": False,
+                             "mrs_enabled": False}
+    assert "config" in update_tables
+
+    # A NULL flag is always written
+    phone_book["session"].run_sql(
+        "UPDATE mysql_rest_service_metadata.config SET service_enabled = NULL WHERE id = 1")
+    update_tables.clear()
+    config_output = configure(**config)
+    assert config_output == {"schema_changed": False,
+                             "mrs_enabled": True}
+    assert update_tables == ["config"]
+
+    monkeypatch.undo()
+
+    config_output = configure(**config)
+    assert status(phone_book["session"])["service_enabled"] == True
+
 
 def test_ls(phone_book):
     list_output = ls("localhost/test")